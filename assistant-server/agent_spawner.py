@@ -132,7 +132,8 @@ class AgentSpawner:
         message = task
         if context:
             import json
-            context_str = json.dumps(context, indent=2)
+            # Compact separators: this is read by the LLM, indentation only costs tokens
+            context_str = json.dumps(context, separators=(",", ":"))
             message = f"{task}\n\nContext:\n{context_str}"
 
         # Inject skill activation prefix so the skill router picks the right skill
@@ -213,7 +214,7 @@ class AgentSpawner:
             import json
             task = config.get("task", f"Run {agent_name} skill and produce a summary.")
             if config:
-                task += f"\n\nConfig:\n{json.dumps({k: v for k, v in config.items() if k != 'task'}, indent=2)}"
+                task += f"\n\nConfig:\n{json.dumps({k: v for k, v in config.items() if k != 'task'}, separators=(',', ':'))}"
 
             message = f"/{skill} {task}" if not task.startswith("/") else task
 
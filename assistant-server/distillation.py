@@ -21,6 +21,7 @@ The LLM can request expansion of any reference by calling expand_reference(ref_i
 import json
 import logging
 import hashlib
+import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Optional
@@ -28,6 +29,12 @@ from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Extraction rules for the LLM-free fallback in _local_rules_summarize
+_UUID_RE = re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', re.I)
+_COUNT_RE = re.compile(r'(?:"count":\s*(\d+)|returned\s+(\d+)\s+rows?|(\d+)\s+(?:results?|items?|records?|rows?))', re.I)
+_NAME_RE = re.compile(r'"(?:canonical_name|name|title)":\s*"([^"]+)"')
+_ERROR_RE = re.compile(r'"error":\s*"([^"]{1,80})')
+
 
 class ContentType(Enum):
     """Types of content that can be stored and referenced."""
@@ -414,28 +421,26 @@ Provide a concise summary (2-4 sentences):"""
         - Names and identifiers
         - Success/error status
         """
-        import re
-        
         if len(content) < self.config.summarize_threshold:
             return content
         
         preserved_parts = []
         
         # Extract UUIDs
-        uuids = re.findall(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', content, re.I)
+        uuids = _UUID_RE.findall(content)
         if uuids:
             unique_uuids = list(dict.fromkeys(uuids))[:8]
             preserved_parts.append(f"IDs: {', '.join(unique_uuids)}")
         
         # Extract counts
-        count_patterns = re.findall(r'(?:"count":\s*(\d+)|returned\s+(\d+)\s+rows?|(\d+)\s+(?:results?|items?|records?|rows?))', content, re.I)
+        count_patterns = _COUNT_RE.findall(content)
         if count_patterns:
             counts = [c for group in count_patterns for c in group if c]
             if counts:
                 preserved_parts.append(f"Counts: {', '.join(counts[:5])}")
         
         # Extract names
-        names = re.findall(r'"(?:canonical_name|name|title)":\s*"([^"]+)"', content)
+        names = _NAME_RE.findall(content)
         if names:
             unique_names = list(dict.fromkeys(names))[:6]
             preserved_parts.append(f"Names: {', '.join(unique_names)}")
@@ -444,7 +449,7 @@ Provide a concise summary (2-4 sentences):"""
         if '"success": true' in content.lower() or '"success":true' in content.lower():
             preserved_parts.append("Status: success")
         elif '"error"' in content.lower():
-            error_match = re.search(r'"error":\s*"([^"]{1,80})', content)
+            error_match = _ERROR_RE.search(content)
             if error_match:
                 preserved_parts.append(f"Error: {error_match.group(1)}")
         
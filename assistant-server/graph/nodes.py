@@ -40,6 +40,12 @@ TOOL_RESULT_SUMMARY_THRESHOLD = 1500
 # After this many requests in a turn, summarize older tool results
 REQUESTS_BEFORE_DISTILL = 3
 
+# IDs, counts, names and errors that _smart_truncate_tool_result keeps from large results
+_UUID_RE = re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', re.I)
+_COUNT_RE = re.compile(r'(?:"count":\s*(\d+)|returned\s+(\d+)\s+rows?|(\d+)\s+(?:results?|items?|records?))', re.I)
+_CANONICAL_NAME_RE = re.compile(r'"canonical_name":\s*"([^"]+)"')
+_ERROR_RE = re.compile(r'"error":\s*"([^"]{1,100})')
+
 
 # -----------------------------------------------------------------------------
 # Distillation Integration
@@ -227,26 +233,24 @@ def _smart_truncate_tool_result(result: str, tool_call_id: str) -> str:
     if len(result) < TOOL_RESULT_SUMMARY_THRESHOLD:
         return result
     
-    import re
-    
     # Extract key patterns to preserve
     preserved_parts = []
     
     # Find all UUIDs (critical for tool follow-ups)
-    uuids = re.findall(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', result, re.I)
+    uuids = _UUID_RE.findall(result)
     if uuids:
         unique_uuids = list(dict.fromkeys(uuids))[:10]  # Keep up to 10 unique UUIDs
         preserved_parts.append(f"IDs found: {', '.join(unique_uuids)}")
     
     # Find count patterns like "count": 5 or "returned 12 rows"
-    count_patterns = re.findall(r'(?:"count":\s*(\d+)|returned\s+(\d+)\s+rows?|(\d+)\s+(?:results?|items?|records?))', result, re.I)
+    count_patterns = _COUNT_RE.findall(result)
     if count_patterns:
         counts = [c for group in count_patterns for c in group if c]
         if counts:
             preserved_parts.append(f"Counts: {', '.join(counts[:5])}")
     
     # Find canonical_name patterns
-    names = re.findall(r'"canonical_name":\s*"([^"]+)"', result)
+    names = _CANONICAL_NAME_RE.findall(result)
     if names:
         unique_names = list(dict.fromkeys(names))[:8]
         preserved_parts.append(f"Names: {', '.join(unique_names)}")
@@ -255,7 +259,7 @@ def _smart_truncate_tool_result(result: str, tool_call_id: str) -> str:
     if '"success": true' in result.lower() or '"success":true' in result.lower():
         preserved_parts.append("Status: success")
     elif '"error"' in result.lower():
-        error_match = re.search(r'"error":\s*"([^"]{1,100})', result)
+        error_match = _ERROR_RE.search(result)
         if error_match:
             preserved_parts.append(f"Error: {error_match.group(1)}")
     